@@ -1,7 +1,14 @@
+import concurrent.futures
+import functools
+import os
+import tempfile
+import warnings
+import zlib
+
 import pandas as pd
-import toolz
 from pkg_resources import parse_version
 
+import ibis.common.exceptions as com
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 from ibis.backends.base import BaseBackend
@@ -10,23 +17,179 @@ from ibis.backends.pandas import PandasDialect
 from ibis.backends.pandas.core import execute, execute_node, pre_execute
 from ibis.backends.pandas.execution.selection import physical_tables
 from ibis.expr.scope import Scope
+from ibis.expr.timecontext import get_time_col
 from ibis.expr.typing import TimeContext
 
 
-def _read_csv(path, schema, **kwargs):
-    dtypes = dict(schema.to_pandas())
+# number of rows parsed at a time when filtering a file by time context
+_CHUNKSIZE = 100_000
+
+# maximum number of files read concurrently by a selection
+_MAX_READ_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=128)
+def _csv_dtypes(schema):
+    """Split `schema` into the dtypes pandas parses directly and the names of
+    the columns it parses as dates.
+    """
+    dtypes = []
+    dates = []
+    for name, dtype in schema.to_pandas():
+        if dtype == 'datetime64[ns]':
+            dates.append(name)
+        else:
+            dtypes.append((name, dtype))
+    return tuple(dtypes), tuple(dates)
+
+
+def _check_time_col(path, schema):
+    """Raise if the table in `path` cannot be filtered by time context, like
+    the pandas backend does for tables without a time column.
+    """
+    time_col = get_time_col()
+    _, dates = _csv_dtypes(schema)
+    if time_col not in dates:
+        raise com.IbisError(
+            f'Table {path.stem} must have a timestamp column named '
+            f'{time_col} to execute with time context.'
+        )
+
+
+def _read_csv(path, schema, timecontext=None, **kwargs):
+    dtypes, dates = _csv_dtypes(schema)
+
+    # pandas rejects date columns that are not read, so only pass the types
+    # of the columns selected by ``usecols``
+    usecols = kwargs.get('usecols')
+    if callable(usecols):
+        dtypes = [(name, dtype) for name, dtype in dtypes if usecols(name)]
+        dates = [name for name in dates if usecols(name)]
+    elif usecols is not None and all(isinstance(c, str) for c in usecols):
+        dtypes = [(name, dtype) for name, dtype in dtypes if name in usecols]
+        dates = [name for name in dates if name in usecols]
+
+    # map local files into memory rather than reading them through a buffer,
+    # unless the caller says otherwise
+    kwargs.setdefault('memory_map', True)
+
+    read = functools.partial(
+        pd.read_csv,
+        str(path),
+        dtype=dict(dtypes),
+        parse_dates=list(dates),
+        encoding='utf-8',
+        **kwargs,
+    )
+    if timecontext is None:
+        return read()
 
-    dates = list(toolz.valfilter(lambda s: s == 'datetime64[ns]', dtypes))
-    dtypes = toolz.dissoc(dtypes, *dates)
+    _check_time_col(path, schema)
 
-    return pd.read_csv(
-        str(path), dtype=dtypes, parse_dates=dates, encoding='utf-8', **kwargs
+    # filter each chunk as it is parsed, so that rows outside of the time
+    # context never accumulate in memory
+    chunks = (
+        _filter_by_time_context(chunk, timecontext)
+        for chunk in read(chunksize=_CHUNKSIZE)
     )
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _filter_by_time_context(df, timecontext):
+    begin, end = timecontext
+    return df.loc[df[get_time_col()].between(begin, end)]
+
+
+def _digest(key):
+    return '{:08x}'.format(zlib.crc32(key.encode('utf-8')))
+
+
+def _cache_prefix(path, schema, read_csv_kwargs):
+    # the parsed result depends on the schema and the parser arguments, so
+    # they are part of the cache file name
+    key = repr((schema, sorted(read_csv_kwargs.items())))
+    return '.{}.{}.'.format(path.stem, _digest(key))
+
+
+def _cache_path(path, prefix, stat):
+    # a copy is only valid for the exact version of the CSV file it was
+    # parsed from, which is identified by its modification time and size
+    stamp = repr((stat.st_mtime_ns, stat.st_size))
+    return path.with_name('{}{}.feather'.format(prefix, _digest(stamp)))
+
+
+def _write_cache(df, cache_path, prefix):
+    """Write `df` to `cache_path` and remove copies of older versions of the
+    same file, warning instead of failing if the copy cannot be written.
+    """
+    tmp_path = None
+    try:
+        # write to a unique temporary file first, other readers of the same
+        # file may be populating the cache concurrently
+        fd, tmp_path = tempfile.mkstemp(
+            suffix='.tmp', dir=str(cache_path.parent)
+        )
+        os.close(fd)
+        df.to_feather(tmp_path)
+        os.replace(tmp_path, str(cache_path))
+    except Exception as e:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        warnings.warn(f'Could not write CSV cache file {cache_path}: {e}')
+        return
+
+    for name in os.listdir(str(cache_path.parent)):
+        if name.startswith(prefix) and name != cache_path.name:
+            try:
+                os.unlink(str(cache_path.parent / name))
+            except OSError:
+                pass
+
+
+def _read_csv_cached(
+    path, schema, read_csv_kwargs, timecontext=None, columns=None
+):
+    """Read a CSV file through a Feather copy of its parsed contents.
+
+    The copy is written next to the CSV file the first time it is read, and
+    rewritten whenever the modification time or size of the CSV file change.
+    """
+    if timecontext is not None:
+        _check_time_col(path, schema)
+
+    # stat the file before parsing it, so that a copy is never labeled with
+    # the version of a file that was rewritten while it was being parsed
+    prefix = _cache_prefix(path, schema, read_csv_kwargs)
+    cache_path = _cache_path(path, prefix, path.stat())
+    try:
+        df = pd.read_feather(str(cache_path), columns=columns)
+    except FileNotFoundError:
+        df = _read_csv(path, schema, header=0, **read_csv_kwargs)
+        _write_cache(df, cache_path, prefix)
+        if columns is not None:
+            df = df.loc[:, columns]
+
+    if timecontext is not None:
+        df = _filter_by_time_context(df, timecontext).reset_index(drop=True)
+    return df
+
+
+@functools.lru_cache(maxsize=128)
+def _csv_header_columns(path, mtime):
+    # ``mtime`` is only part of the cache key, so that a rewritten file
+    # has its header parsed again
+    return frozenset(pd.read_csv(path, nrows=0, encoding='utf-8').columns)
+
+
+def _header_columns(path):
+    path = str(path)
+    return _csv_header_columns(path, os.stat(path).st_mtime_ns)
 
 
 class CSVTable(ops.DatabaseTable):
-    def __init__(self, name, schema, source, **kwargs):
+    def __init__(self, name, schema, source, cache=False, **kwargs):
         super().__init__(name, schema, source)
+        self.cache = cache
         self.read_csv_kwargs = kwargs
 
 
@@ -36,7 +199,27 @@ class CSVClient(FileClient):
         data = execute(expr)
         data.to_csv(str(path), index=index, **kwargs)
 
-    def table(self, name, path=None, schema=None, **kwargs):
+    def table(self, name, path=None, schema=None, cache=False, **kwargs):
+        """Get a table expression for the CSV file `name`.
+
+        Parameters
+        ----------
+        name : str
+        path : Optional[pathlib.Path]
+            Directory containing the file, defaults to the client's root.
+        schema : Optional[ibis.expr.schema.Schema]
+            Partial schema, the types of other columns are inferred.
+        cache : bool
+            Whether to keep a Feather copy of the parsed file next to it and
+            read from that copy until the CSV file is modified. Requires
+            pyarrow.
+        kwargs : Dict[str, object]
+            Additional arguments passed to :func:`pandas.read_csv`.
+
+        Returns
+        -------
+        ibis.expr.types.TableExpr
+        """
         if name not in self.list_tables(path):
             raise AttributeError(name)
 
@@ -52,7 +235,9 @@ class CSVClient(FileClient):
 
         # infer sample's schema and define table
         schema = sch.infer(sample, schema=schema)
-        table = self.table_class(name, schema, self, **kwargs).to_expr()
+        table = self.table_class(
+            name, schema, self, cache=cache, **kwargs
+        ).to_expr()
 
         self.dictionary[name] = f
 
@@ -80,30 +265,61 @@ def csv_pre_execute_selection(
     timecontext: TimeContext = None,
     **kwargs,
 ):
-    tables = filter(
-        lambda t: scope.get_value(t, timecontext) is None,
-        physical_tables(op.table.op()),
-    )
+    tables = [
+        table
+        for table in physical_tables(op.table.op())
+        if scope.get_value(table, timecontext) is None
+    ]
 
-    ops = Scope()
-    for table in tables:
+    def read(table):
         path = client.dictionary[table.name]
-        usecols = None
+        requested = None
 
         if op.selections:
-            header = _read_csv(path, schema=table.schema, header=0, nrows=1)
-            usecols = [
+            requested = frozenset(
                 getattr(s.op(), 'name', None) or s.get_name()
                 for s in op.selections
-            ]
+            )
 
             # we cannot read all the columns that we would like
-            if len(pd.Index(usecols) & header.columns) != len(usecols):
-                usecols = None
-        result = _read_csv(path, table.schema, usecols=usecols, header=0)
-        ops = ops.merge_scope(Scope({table: result}, timecontext))
-
-    return ops
+            if not _header_columns(path).issuperset(requested):
+                requested = None
+            elif timecontext is not None:
+                # the time column is needed to filter by time context
+                requested |= {get_time_col()}
+
+        if table.cache:
+            result = _read_csv_cached(
+                path,
+                table.schema,
+                table.read_csv_kwargs,
+                timecontext=timecontext,
+                columns=None
+                if requested is None
+                else [name for name in table.schema if name in requested],
+            )
+        else:
+            # let the parser drop unselected columns while tokenizing
+            result = _read_csv(
+                path,
+                table.schema,
+                timecontext=timecontext,
+                usecols=None if requested is None else requested.__contains__,
+                header=0,
+            )
+        return Scope({table: result}, timecontext)
+
+    if len(tables) > 1:
+        # the C parser releases the GIL while tokenizing, so the tables of a
+        # join can be read concurrently
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(_MAX_READ_WORKERS, len(tables))
+        ) as executor:
+            scopes = list(executor.map(read, tables))
+    else:
+        scopes = list(map(read, tables))
+
+    return Scope().merge_scopes(scopes)
 
 
 class Backend(BaseBackend):
@@ -128,7 +344,17 @@ class Backend(BaseBackend):
 
 
 @execute_node.register(Backend.table_class, CSVClient)
-def csv_read_table(op, client, scope, **kwargs):
+def csv_read_table(op, client, scope, timecontext=None, **kwargs):
     path = client.dictionary[op.name]
-    df = _read_csv(path, schema=op.schema, header=0, **op.read_csv_kwargs)
+    if op.cache:
+        return _read_csv_cached(
+            path, op.schema, op.read_csv_kwargs, timecontext=timecontext
+        )
+    df = _read_csv(
+        path,
+        schema=op.schema,
+        timecontext=timecontext,
+        header=0,
+        **op.read_csv_kwargs,
+    )
     return df
@@ -1,9 +1,13 @@
+import os
+
+import pandas as pd
 import pytest
 from pandas.util import testing as tm
 
 import ibis
+import ibis.common.exceptions as com
 from ibis.backends.base_file import FileDatabase
-from ibis.backends.csv import CSVTable
+from ibis.backends.csv import CSVTable, _header_columns
 
 
 @pytest.fixture
@@ -114,3 +118,134 @@ def test_insert(transformed, tmpdir):
 
     result = t.foo.execute()
     tm.assert_frame_equal(result, expected)
+
+
+def test_header_columns_refreshed_on_rewrite(tmpdir):
+    path = tmpdir / 'df.csv'
+    pd.DataFrame({'a': [1], 'b': [2]}).to_csv(str(path), index=False)
+    assert _header_columns(path) == {'a', 'b'}
+
+    pd.DataFrame({'c': [3]}).to_csv(str(path), index=False)
+    os.utime(str(path), ns=(0, 0))
+    assert _header_columns(path) == {'c'}
+
+
+@pytest.mark.parametrize('chunksize', [1, 7, 100_000])
+def test_read_with_timecontext(
+    tmpdir, file_backends_data, monkeypatch, chunksize
+):
+    monkeypatch.setattr(ibis.backends.csv, '_CHUNKSIZE', chunksize)
+    file_backends_data['close'].to_csv(str(tmpdir / 'close.csv'), index=False)
+    schema = ibis.schema([('time', 'timestamp')])
+    closes = ibis.csv.connect(tmpdir).table('close', schema=schema)
+
+    context = (pd.Timestamp('20170102'), pd.Timestamp('20170104'))
+    result = closes.execute(timecontext=context)
+
+    expected = file_backends_data['close']
+    expected = expected[expected.time.between(*context)]
+    tm.assert_frame_equal(result, expected.reset_index(drop=True))
+
+
+def test_read_projection_without_date_column(tmpdir, file_backends_data):
+    file_backends_data['close'].to_csv(str(tmpdir / 'close.csv'), index=False)
+    schema = ibis.schema([('time', 'timestamp')])
+    closes = ibis.csv.connect(tmpdir).table('close', schema=schema)
+
+    result = closes[['close']].execute()
+    expected = file_backends_data['close'][['close']]
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_projection_with_timecontext(tmpdir, file_backends_data):
+    file_backends_data['close'].to_csv(str(tmpdir / 'close.csv'), index=False)
+    schema = ibis.schema([('time', 'timestamp')])
+    closes = ibis.csv.connect(tmpdir).table('close', schema=schema)
+
+    context = (pd.Timestamp('20170102'), pd.Timestamp('20170104'))
+    result = closes[['close']].execute(timecontext=context)
+
+    expected = file_backends_data['close']
+    expected = expected[expected.time.between(*context)][['close']]
+    tm.assert_frame_equal(result, expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize('schema', [None, ibis.schema([('time', 'string')])])
+def test_read_with_timecontext_without_timestamp(
+    tmpdir, file_backends_data, schema
+):
+    file_backends_data['close'].to_csv(str(tmpdir / 'close.csv'), index=False)
+    closes = ibis.csv.connect(tmpdir).table('close', schema=schema)
+
+    context = (pd.Timestamp('20170102'), pd.Timestamp('20170104'))
+    with pytest.raises(com.IbisError, match='timestamp column named time'):
+        closes.execute(timecontext=context)
+
+
+def test_read_with_cache(tmpdir, file_backends_data):
+    pytest.importorskip('pyarrow')
+    path = tmpdir / 'close.csv'
+    file_backends_data['close'].to_csv(str(path), index=False)
+    closes = ibis.csv.connect(tmpdir).table('close', cache=True)
+
+    expected = closes.execute()
+    cached = [p for p in os.listdir(str(tmpdir)) if p.endswith('.feather')]
+    assert len(cached) == 1
+
+    tm.assert_frame_equal(closes.execute(), expected)
+    result = closes[['time', 'close']].execute()
+    tm.assert_frame_equal(result, expected[['time', 'close']])
+
+    # modifying the csv file invalidates the cached copy
+    file_backends_data['close'].head(3).to_csv(str(path), index=False)
+    assert len(closes.execute()) == 3
+    recached = [p for p in os.listdir(str(tmpdir)) if p.endswith('.feather')]
+    assert len(recached) == 1 and recached != cached
+
+
+def test_read_with_cache_rewritten_with_same_mtime(tmpdir, file_backends_data):
+    pytest.importorskip('pyarrow')
+    path = tmpdir / 'close.csv'
+    file_backends_data['close'].to_csv(str(path), index=False)
+    closes = ibis.csv.connect(tmpdir).table('close', cache=True)
+    expected = closes.execute()
+
+    # e.g. a copy restored with its original timestamps
+    stat = os.stat(str(path))
+    file_backends_data['close'].head(2).to_csv(str(path), index=False)
+    os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    tm.assert_frame_equal(closes.execute(), expected.head(2))
+
+
+def test_read_with_cache_and_timecontext(tmpdir, file_backends_data):
+    pytest.importorskip('pyarrow')
+    file_backends_data['close'].to_csv(str(tmpdir / 'close.csv'), index=False)
+    client = ibis.csv.connect(tmpdir)
+    context = (pd.Timestamp('20170102'), pd.Timestamp('20170104'))
+
+    schema = ibis.schema([('time', 'timestamp')])
+    closes = client.table('close', schema=schema, cache=True)
+    result = closes.execute(timecontext=context)
+    expected = file_backends_data['close']
+    expected = expected[expected.time.between(*context)]
+    tm.assert_frame_equal(result, expected.reset_index(drop=True))
+
+    closes = client.table('close', cache=True)
+    with pytest.raises(com.IbisError, match='timestamp column named time'):
+        closes.execute(timecontext=context)
+
+
+def test_read_with_cache_write_failure(
+    tmpdir, file_backends_data, monkeypatch
+):
+    file_backends_data['close'].to_csv(str(tmpdir / 'close.csv'), index=False)
+    closes = ibis.csv.connect(tmpdir).table('close', cache=True)
+
+    def to_feather(*args, **kwargs):
+        raise OSError('No space left on device')
+
+    monkeypatch.setattr(pd.DataFrame, 'to_feather', to_feather)
+    with pytest.warns(UserWarning, match='No space left on device'):
+        result = closes.execute()
+    assert len(result) == len(file_backends_data['close'])
+    assert sorted(os.listdir(str(tmpdir))) == ['close.csv']
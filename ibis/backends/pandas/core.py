@@ -107,6 +107,7 @@ from __future__ import absolute_import
 
 import datetime
 import functools
+import itertools
 import numbers
 from typing import Optional
 
@@ -126,7 +127,14 @@ from ibis.expr.timecontext import canonicalize_context
 from ibis.expr.typing import TimeContext
 
 from . import aggcontext as agg_ctx
-from .dispatch import execute_literal, execute_node, post_execute, pre_execute
+from .dispatch import (
+    execute_literal,
+    execute_node,
+    post_execute,
+    pre_execute,
+    pre_execute_default,
+    pre_execute_multiple_clients,
+)
 from .trace import trace
 
 integer_types = np.integer, int
@@ -168,6 +176,65 @@ ibis.util.consume(
 )
 
 
+# Whether an input is computable only depends on its type, so we memoize the
+# result of is_computable_input per type, together with the implementation it
+# was computed with. Registering a new implementation changes what
+# ``is_computable_input.dispatch`` resolves to, which invalidates the memo.
+_computable_input_types = {}
+
+
+def _is_computable_input(arg) -> bool:
+    """Memoized version of :func:`is_computable_input`."""
+    cls = type(arg)
+    func = is_computable_input.dispatch(cls)
+    try:
+        memo_func, result = _computable_input_types[cls]
+    except KeyError:
+        pass
+    else:
+        if memo_func is func:
+            return result
+    result = func(arg)
+    _computable_input_types[cls] = func, result
+    return result
+
+
+def _dispatch(dispatcher, *types):
+    """Resolve the implementation of `dispatcher` for `types`.
+
+    This shares the dispatcher's own cache, which is reset whenever a new
+    implementation is registered. The result is only meant to be compared
+    against known implementations: calling it directly would skip the
+    dispatcher's fall through to the next matching implementation when one
+    raises ``MDNotImplementedError``, so call the dispatcher instead.
+    """
+    cache = dispatcher._cache
+    try:
+        return cache[types]
+    except KeyError:
+        func = dispatcher.dispatch(*types)
+        if func is not None:
+            cache[types] = func
+        return func
+
+
+def _overrides_pre_execute(op, clients):
+    """Return whether any of `clients` has a ``pre_execute`` implementation
+    for `op` other than the default one, which returns an empty scope.
+    """
+    op_type = type(op)
+    func = _dispatch(
+        pre_execute, op_type, *(type(client) for client in clients)
+    )
+    if func is pre_execute_multiple_clients:
+        return any(
+            _dispatch(pre_execute, op_type, type(client))
+            is not pre_execute_default
+            for client in clients
+        )
+    return func is not pre_execute_default
+
+
 def execute_with_scope(
     expr,
     scope: Scope,
@@ -207,15 +274,20 @@ def execute_with_scope(
     if aggcontext is None:
         aggcontext = agg_ctx.Summarize()
 
-    pre_executed_scope = pre_execute(
-        op,
-        *clients,
-        scope=scope,
-        timecontext=timecontext,
-        aggcontext=aggcontext,
-        **kwargs,
-    )
-    new_scope = scope.merge_scope(pre_executed_scope)
+    if _overrides_pre_execute(op, clients):
+        pre_executed_scope = pre_execute(
+            op,
+            *clients,
+            scope=scope,
+            timecontext=timecontext,
+            aggcontext=aggcontext,
+            **kwargs,
+        )
+        new_scope = scope.merge_scope(pre_executed_scope)
+    else:
+        # scopes are never modified in place during execution, so there is
+        # no need to copy it
+        new_scope = scope
     result = execute_until_in_scope(
         expr,
         new_scope,
@@ -284,7 +356,7 @@ def execute_until_in_scope(
     # figure out what arguments we're able to compute on based on the
     # expressions inputs. things like expressions, None, and scalar types are
     # computable whereas ``list``s are not
-    computable_args = [arg for arg in op.inputs if is_computable_input(arg)]
+    computable_args = list(filter(_is_computable_input, op.inputs))
 
     # pre_executed_states is a list of states with same the length of
     # computable_args, these states are passed to each arg
@@ -295,67 +367,66 @@ def execute_until_in_scope(
             timecontext=timecontext,
             clients=clients,
         )
-    else:
-        arg_timecontexts = [None] * len(computable_args)
 
-    pre_executed_scope = pre_execute(
-        op,
-        *clients,
-        scope=scope,
-        timecontext=timecontext,
-        aggcontext=aggcontext,
-        **kwargs,
-    )
-
-    new_scope = scope.merge_scope(pre_executed_scope)
-
-    # Short circuit: if pre_execute puts op in scope, then we don't need to
-    # execute its computable_args
-    if new_scope.get_value(op, timecontext) is not None:
-        return new_scope
-
-    # recursively compute each node's arguments until we've changed type.
-    # compute_time_context should return with a list with the same length
-    # as computable_args, the two lists will be zipping together for
-    # further execution
-    if len(arg_timecontexts) != len(computable_args):
-        raise com.IbisError(
-            'arg_timecontexts differ with computable_arg in length '
-            f'for type:\n{type(op).__name__}.'
-        )
+        # compute_time_context should return with a list with the same
+        # length as computable_args, the two lists will be zipping together
+        # for further execution
+        if len(arg_timecontexts) != len(computable_args):
+            raise com.IbisError(
+                'arg_timecontexts differ with computable_arg in length '
+                f'for type:\n{type(op).__name__}.'
+            )
+    else:
+        arg_timecontexts = itertools.repeat(None)
 
-    scopes = [
-        execute_until_in_scope(
-            arg,
-            new_scope,
+    if _overrides_pre_execute(op, clients):
+        pre_executed_scope = pre_execute(
+            op,
+            *clients,
+            scope=scope,
             timecontext=timecontext,
             aggcontext=aggcontext,
-            post_execute_=post_execute_,
-            clients=clients,
             **kwargs,
         )
-        if hasattr(arg, 'op')
-        else Scope({arg: arg}, timecontext)
-        for (arg, timecontext) in zip(computable_args, arg_timecontexts)
-    ]
 
-    # if we're unable to find data then raise an exception
-    if not scopes and computable_args:
-        raise com.UnboundExpressionError(
-            'Unable to find data for expression:\n{}'.format(repr(expr))
-        )
+        new_scope = scope.merge_scope(pre_executed_scope)
 
-    # there should be exactly one dictionary per computable argument
-    assert len(computable_args) == len(scopes)
+        # Short circuit: if pre_execute puts op in scope, then we don't need
+        # to execute its computable_args
+        if new_scope.get_value(op, timecontext) is not None:
+            return new_scope
+    else:
+        new_scope = scope
+
+    # recursively compute each node's arguments until we've changed type.
+    # leaf arguments are passed to execute_node as is, so only expressions
+    # need to be executed. Their values are read from the scope they were
+    # computed in, rather than from a merged copy of all of them.
+    data = list(computable_args)
+    for i, (arg, arg_timecontext) in enumerate(
+        zip(computable_args, arg_timecontexts)
+    ):
+        if hasattr(arg, 'op'):
+            arg_op = arg.op()
+            arg_scope = new_scope
+
+            # skip the call entirely if the argument is already in scope,
+            # instead of paying for it just to hit the base case
+            if new_scope.get_value(arg_op, arg_timecontext) is None:
+                arg_scope = execute_until_in_scope(
+                    arg,
+                    new_scope,
+                    timecontext=arg_timecontext,
+                    aggcontext=aggcontext,
+                    post_execute_=post_execute_,
+                    clients=clients,
+                    **kwargs,
+                )
+
+            # pass our computed arguments to this node's execute_node
+            # implementation
+            data[i] = arg_scope.get_value(arg_op, timecontext)
 
-    new_scope = new_scope.merge_scopes(scopes)
-    # pass our computed arguments to this node's execute_node implementation
-    data = [
-        new_scope.get_value(arg.op(), timecontext)
-        if hasattr(arg, 'op')
-        else arg
-        for arg in computable_args
-    ]
     result = execute_node(
         op,
         *data,
@@ -535,6 +606,14 @@ See ``computable_args`` in ``execute_until_in_scope``
 
 @compute_time_context.register(ops.Node)
 def compute_time_context_default(
-    node, timecontext: Optional[TimeContext] = None, **kwargs
+    node,
+    timecontext: Optional[TimeContext] = None,
+    *,
+    num_args: Optional[int] = None,
+    **kwargs,
 ):
-    return [timecontext for arg in node.inputs if is_computable_input(arg)]
+    # execute_until_in_scope already knows how many computable inputs the
+    # node has, so only count them when called without it
+    if num_args is None:
+        num_args = sum(map(_is_computable_input, node.inputs))
+    return [timecontext] * num_args
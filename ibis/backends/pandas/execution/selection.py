@@ -249,7 +249,7 @@ def _compute_predicates(
         # handle suffixes
         data_columns = frozenset(data.columns)
 
-        additional_scope = Scope()
+        additional_scopes = []
         for root_table in root_tables:
             mapping = remap_overlapping_column_names(
                 table_op, root_table, data_columns
@@ -258,11 +258,11 @@ def _compute_predicates(
                 new_data = data.loc[:, mapping.keys()].rename(columns=mapping)
             else:
                 new_data = data
-            additional_scope = additional_scope.merge_scope(
+            additional_scopes.append(
                 Scope({root_table: new_data}, timecontext)
             )
 
-        scope = scope.merge_scope(additional_scope)
+        scope = scope.merge_scopes(additional_scopes)
         yield execute(predicate, scope=scope, **kwargs)
 
 
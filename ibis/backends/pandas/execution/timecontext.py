@@ -35,7 +35,7 @@ import ibis.expr.operations as ops
 from ibis.expr.timecontext import adjust_context
 from ibis.expr.typing import TimeContext
 
-from ..core import compute_time_context, is_computable_input
+from ..core import _is_computable_input, compute_time_context
 
 
 @compute_time_context.register(ops.AsOfJoin)
@@ -43,7 +43,7 @@ def compute_time_context_asof_join(
     op, clients, timecontext: Optional[TimeContext] = None, **kwargs
 ):
     new_timecontexts = [
-        timecontext for arg in op.inputs if is_computable_input(arg)
+        timecontext for arg in op.inputs if _is_computable_input(arg)
     ]
 
     if not timecontext:
@@ -63,7 +63,7 @@ def compute_time_context_window(
     op, clients, timecontext: Optional[TimeContext] = None, **kwargs
 ):
     new_timecontexts = [
-        timecontext for arg in op.inputs if is_computable_input(arg)
+        timecontext for arg in op.inputs if _is_computable_input(arg)
     ]
 
     if not timecontext:
@@ -72,6 +72,6 @@ def compute_time_context_window(
     result = adjust_context(op, timecontext=timecontext)
 
     new_timecontexts = [
-        result for arg in op.inputs if is_computable_input(arg)
+        result for arg in op.inputs if _is_computable_input(arg)
     ]
     return new_timecontexts
@@ -1,13 +1,21 @@
+import functools
+
 import pandas as pd
 import pandas.testing as tm
 import pytest
 
 import ibis
 import ibis.common.exceptions as com
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.types as ir
+from ibis.backends.pandas.core import compute_time_context
+from ibis.backends.pandas.dispatch import execute_node
 from ibis.backends.pandas.execution.window import trim_window_series
 from ibis.expr.timecontext import (
     TimeContextRelation,
     adjust_context,
+    canonicalize_context,
     compare_timecontext,
     construct_time_context_aware_series,
 )
@@ -78,6 +86,12 @@ def test_compare_timecontext():
     assert compare_timecontext(c1, c3) == TimeContextRelation.NONOVERLAP
 
 
+def test_canonicalize_context():
+    context = (pd.Timestamp('20170101'), pd.Timestamp('20170103'))
+    assert canonicalize_context(context) is context
+    assert canonicalize_context(list(context)) == context
+
+
 def test_context_adjustment_asof_join(
     time_keyed_left, time_keyed_right, time_keyed_df1, time_keyed_df2
 ):
@@ -104,6 +118,30 @@ def test_context_adjustment_asof_join(
     tm.assert_frame_equal(result, expected)
 
 
+def test_same_argument_with_different_timecontexts(time_table):
+    class CountDifference(ops.ValueOp):
+        left = ops.Arg(ir.TableExpr)
+        right = ops.Arg(ir.TableExpr)
+
+        def output_type(self):
+            return functools.partial(ir.IntegerScalar, dtype=dt.int64)
+
+    @compute_time_context.register(CountDifference)
+    def compute_time_context_count_difference(op, timecontext, **kwargs):
+        begin, end = timecontext
+        return [timecontext, (begin - pd.Timedelta(days=2), end)]
+
+    @execute_node.register(CountDifference, pd.DataFrame, pd.DataFrame)
+    def execute_count_difference(op, left, right, **kwargs):
+        return len(right) - len(left)
+
+    # the same table is an argument under two time contexts, each argument
+    # receives the rows of its own context
+    expr = CountDifference(time_table, time_table).to_expr()
+    context = (pd.Timestamp('20170105'), pd.Timestamp('20170107'))
+    assert expr.execute(timecontext=context) == 2
+
+
 @pytest.mark.parametrize(
     ['interval_ibis', 'interval_pd'],
     [
@@ -1,3 +1,4 @@
+import abc
 from typing import Any
 
 import pandas as pd
@@ -13,7 +14,7 @@ from ibis.expr.scope import Scope
 
 from .. import Backend, execute
 from ..client import PandasClient
-from ..core import is_computable_input
+from ..core import _is_computable_input, is_computable_input
 from ..dispatch import execute_node, post_execute, pre_execute
 
 pytestmark = pytest.mark.pandas
@@ -186,6 +187,28 @@ def test_is_computable_input():
     dt.infer._cache.clear()
 
 
+def test_is_computable_input_memoized_per_type():
+    class MyObject:
+        pass
+
+    class MyABC(abc.ABC):
+        pass
+
+    obj = MyObject()
+    assert not _is_computable_input(obj)
+
+    # registering an abstract base class and then a virtual subclass of it
+    # must invalidate the memoized result
+    @is_computable_input.register(MyABC)
+    def is_computable_input_my_abc(_):
+        return True
+
+    assert not _is_computable_input(obj)
+    MyABC.register(MyObject)
+    assert is_computable_input(obj)
+    assert _is_computable_input(obj)
+
+
 def test_scope_look_up():
     # test if scope could lookup items properly
     scope = Scope()
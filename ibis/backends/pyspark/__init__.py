@@ -22,6 +22,12 @@ class Backend(BaseBackend):
         Pipes `**kwargs` into SparkClient, which pipes them into SparkContext.
         See documentation for SparkContext:
         https://spark.apache.org/docs/latest/api/python/_modules/pyspark/context.html#SparkContext
+
+        Results are converted to pandas with the session's own settings. To
+        transfer them as Arrow record batches, enable
+        ``spark.sql.execution.arrow.enabled`` (``.pyspark.enabled`` in Spark
+        3) on the session. Note that array columns are then returned as numpy
+        arrays rather than lists.
         """
         client = PySparkClient(backend=self, session=session)
 
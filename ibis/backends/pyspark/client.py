@@ -1,3 +1,5 @@
+import functools
+
 from pyspark.sql.column import Column
 
 import ibis.common.exceptions as com
@@ -8,6 +10,10 @@ from ibis.expr.timecontext import canonicalize_context, localize_context
 
 from .compiler import PySparkExprTranslator
 
+# Localizing the bounds of a time context is comparatively expensive, and the
+# same contexts tend to be executed repeatedly
+_localize_context = functools.lru_cache(maxsize=256)(localize_context)
+
 
 class PySparkClient(SparkClient):
     """
@@ -17,6 +23,10 @@ class PySparkClient(SparkClient):
     def __init__(self, backend, session):
         super().__init__(backend, session)
         self.translator = PySparkExprTranslator()
+        # single row DataFrame that scalar results are selected from
+        self._scalar_scaffold = None
+        # DataFrames persisted by execute(..., cache=True)
+        self._persisted = []
 
     def compile(self, expr, timecontext=None, params=None, *args, **kwargs):
         """Compile an ibis expression to a PySpark DataFrame object
@@ -28,7 +38,7 @@ class PySparkClient(SparkClient):
             )
             # Since spark use session timezone for tz-naive timestamps
             # we localize tz-naive context here to match that behavior
-            timecontext = localize_context(
+            timecontext = _localize_context(
                 canonicalize_context(timecontext), session_timezone
             )
 
@@ -45,24 +55,77 @@ class PySparkClient(SparkClient):
         )
 
     def execute(
-        self, expr, timecontext=None, params=None, limit='default', **kwargs
+        self,
+        expr,
+        timecontext=None,
+        params=None,
+        limit='default',
+        cache=False,
+        **kwargs,
     ):
+        """Execute an ibis expression and return the result as pandas
+        objects.
+
+        Parameters
+        ----------
+        expr : Expr
+        timecontext : Optional[TimeContext]
+        params : dict
+        limit : string
+        cache : bool, default False
+          Persist the DataFrame of a table or column expression before
+          collecting it. Spark serves later executions of the same
+          expression from the persisted data until it is released with
+          :meth:`unpersist`. Not supported for scalar expressions.
+
+        Returns
+        -------
+        output : input type dependent
+          Table expressions: pandas.DataFrame
+          Array expressions: pandas.Series
+          Scalar expressions: Python scalar value
+        """
+        if cache and isinstance(expr, types.ScalarExpr):
+            raise com.IbisError(
+                'cache=True is only supported for table and column '
+                'expressions'
+            )
+
         if isinstance(expr, types.TableExpr):
-            return self.compile(expr, timecontext, params, **kwargs).toPandas()
+            compiled = self.compile(expr, timecontext, params, **kwargs)
+            if cache:
+                compiled = self._persist(compiled)
+            return compiled.toPandas()
         elif isinstance(expr, types.ColumnExpr):
             # expression must be named for the projection
             expr = expr.name('tmp')
-            return self.compile(
+            compiled = self.compile(
                 expr.to_projection(), timecontext, params, **kwargs
-            ).toPandas()['tmp']
+            )
+            if cache:
+                compiled = self._persist(compiled)
+            return compiled.toPandas()['tmp']
         elif isinstance(expr, types.ScalarExpr):
             compiled = self.compile(expr, timecontext, params, **kwargs)
             if isinstance(compiled, Column):
                 # attach result column to a fake DataFrame and
                 # select the result
-                compiled = self._session.range(0, 1).select(compiled)
+                if self._scalar_scaffold is None:
+                    self._scalar_scaffold = self._session.range(0, 1)
+                compiled = self._scalar_scaffold.select(compiled)
             return compiled.toPandas().iloc[0, 0]
         else:
             raise com.IbisError(
                 "Cannot execute expression of type: {}".format(type(expr))
             )
+
+    def _persist(self, df):
+        df = df.cache()
+        self._persisted.append(df)
+        return df
+
+    def unpersist(self):
+        """Release the DataFrames persisted by ``execute(..., cache=True)``.
+        """
+        while self._persisted:
+            self._persisted.pop().unpersist()
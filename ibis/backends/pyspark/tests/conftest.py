@@ -90,6 +90,16 @@ def client():
     return client
 
 
+@pytest.fixture(scope='session')
+def time_indexed_table(client):
+    return client.table('time_indexed_table')
+
+
+@pytest.fixture(scope='session')
+def time_indexed_df(time_indexed_table):
+    return time_indexed_table.execute()
+
+
 class IbisWindow:
     # Test util class to generate different types of ibis windows
     def __init__(self, windows):
@@ -18,6 +18,27 @@ def test_basic(client):
     tm.assert_frame_equal(result, expected)
 
 
+def test_execute_with_cache(client):
+    table = client.table('basic_table')
+    try:
+        result = client.execute(table, cache=True)
+        expected = pd.DataFrame({'id': range(0, 10), 'str_col': 'value'})
+        tm.assert_frame_equal(result, expected)
+
+        # the persisted data is shared with DataFrames of the same plan
+        assert table.compile().storageLevel.useMemory
+    finally:
+        client.unpersist()
+
+    assert not table.compile().storageLevel.useMemory
+
+
+def test_execute_scalar_with_cache(client):
+    table = client.table('basic_table')
+    with pytest.raises(com.IbisError, match='cache=True'):
+        client.execute(table['id'].max(), cache=True)
+
+
 def test_projection(client):
     table = client.table('basic_table')
     result1 = table.mutate(v=table['id']).compile().toPandas()
@@ -7,12 +7,11 @@ from ibis.backends.pyspark.timecontext import combine_time_context
 pytestmark = pytest.mark.pyspark
 
 
-def test_table_with_timecontext(client):
-    table = client.table('time_indexed_table')
+def test_table_with_timecontext(time_indexed_table, time_indexed_df):
+    table = time_indexed_table
     context = (pd.Timestamp('20170102'), pd.Timestamp('20170103'))
     result = table.execute(timecontext=context)
-    expected = table.execute()
-    expected = expected[expected.time.between(*context)]
+    expected = time_indexed_df[time_indexed_df.time.between(*context)]
     tm.assert_frame_equal(result, expected)
 
 
@@ -25,7 +25,9 @@ pytestmark = pytest.mark.pyspark
     ],
     indirect=['ibis_windows'],
 )
-def test_window_with_timecontext(client, ibis_windows, spark_range):
+def test_window_with_timecontext(
+    time_indexed_table, ibis_windows, spark_range
+):
     """ Test context adjustment for trailing / range window
 
     We expand context according to window sizes, for example, for a table of:
@@ -48,7 +50,7 @@ def test_window_with_timecontext(client, ibis_windows, spark_range):
     2020-01-01   a      2
     2020-01-02   b      2
     """
-    table = client.table('time_indexed_table')
+    table = time_indexed_table
     context = (
         pd.Timestamp('20170102 07:00:00', tz='UTC'),
         pd.Timestamp('20170103', tz='UTC'),
@@ -76,7 +78,7 @@ def test_window_with_timecontext(client, ibis_windows, spark_range):
     [([(None, 0)], (Window.unboundedPreceding, 0))],
     indirect=['ibis_windows'],
 )
-def test_cumulative_window(client, ibis_windows, spark_range):
+def test_cumulative_window(time_indexed_table, ibis_windows, spark_range):
     """ Test context adjustment for cumulative window
 
     For cumulative window, by defination we should look back infinately.
@@ -92,7 +94,7 @@ def test_cumulative_window(client, ibis_windows, spark_range):
     2020-01-02   b      1
     2020-01-03   c      2
     """
-    table = client.table('time_indexed_table')
+    table = time_indexed_table
     context = (
         pd.Timestamp('20170102 07:00:00', tz='UTC'),
         pd.Timestamp('20170105', tz='UTC'),
@@ -126,14 +128,16 @@ def test_cumulative_window(client, ibis_windows, spark_range):
     ],
     indirect=['ibis_windows'],
 )
-def test_multiple_trailing_window(client, ibis_windows, spark_range):
+def test_multiple_trailing_window(
+    time_indexed_table, ibis_windows, spark_range
+):
     """ Test context adjustment for multiple trailing window
 
     When there are multiple window ops, we need to verify contexts are
     adjusted correctly for all windows. In this tests we are constucting
     one trailing window for 1h and another trailng window for 2h
     """
-    table = client.table('time_indexed_table')
+    table = time_indexed_table
     context = (
         pd.Timestamp('20170102 07:00:00', tz='UTC'),
         pd.Timestamp('20170105', tz='UTC'),
@@ -179,7 +183,9 @@ def test_multiple_trailing_window(client, ibis_windows, spark_range):
     ],
     indirect=['ibis_windows'],
 )
-def test_chained_trailing_window(client, ibis_windows, spark_range):
+def test_chained_trailing_window(
+    time_indexed_table, ibis_windows, spark_range
+):
     """ Test context adjustment for chained windows
 
     When there are chained window ops, we need to verify contexts are
@@ -187,7 +193,7 @@ def test_chained_trailing_window(client, ibis_windows, spark_range):
     one trailing window for 1h and trailng window on the new column for
     2h
     """
-    table = client.table('time_indexed_table')
+    table = time_indexed_table
     context = (
         pd.Timestamp('20170102 07:00:00', tz='UTC'),
         pd.Timestamp('20170105', tz='UTC'),
@@ -235,7 +241,9 @@ def test_chained_trailing_window(client, ibis_windows, spark_range):
     ],
     indirect=['ibis_windows'],
 )
-def test_rolling_with_cumulative_window(client, ibis_windows, spark_range):
+def test_rolling_with_cumulative_window(
+    time_indexed_table, ibis_windows, spark_range
+):
     """ Test context adjustment for rolling window and cumulative window
 
     cumulative window should calculate only with in user's context,
@@ -251,7 +259,7 @@ def test_rolling_with_cumulative_window(client, ibis_windows, spark_range):
     2020-01-02   b      2            1
     2020-01-03   c      2            2
     """
-    table = client.table('time_indexed_table')
+    table = time_indexed_table
     context = (
         pd.Timestamp('20170102 07:00:00', tz='UTC'),
         pd.Timestamp('20170105', tz='UTC'),
@@ -297,7 +305,9 @@ def test_rolling_with_cumulative_window(client, ibis_windows, spark_range):
     [([(ibis.interval(hours=1), 0)], [(-3600, 0)])],
     indirect=['ibis_windows'],
 )
-def test_rolling_with_non_window_op(client, ibis_windows, spark_range):
+def test_rolling_with_non_window_op(
+    time_indexed_table, ibis_windows, spark_range
+):
     """ Test context adjustment for rolling window and non window ops
 
     non window ops should calculate only with in user's context,
@@ -317,7 +327,7 @@ def test_rolling_with_non_window_op(client, ibis_windows, spark_range):
     count should return 3 for every row, rather 4, based on the
     adjusted context (01-01, 01-04).
     """
-    table = client.table('time_indexed_table')
+    table = time_indexed_table
     context = (
         pd.Timestamp('20170102 07:00:00', tz='UTC'),
         pd.Timestamp('20170105', tz='UTC'),
@@ -351,12 +361,12 @@ def test_rolling_with_non_window_op(client, ibis_windows, spark_range):
     'non window op throws error for pyspark backend',
     strict=True,
 )
-def test_complex_window(client):
+def test_complex_window(time_indexed_table, time_indexed_df):
     """ Test window with different sizes
         mix context adjustment for window op that require context
         adjustment and non window op that doesn't adjust context
     """
-    table = client.table('time_indexed_table')
+    table = time_indexed_table
     context = (
         pd.Timestamp('20170102 07:00:00', tz='UTC'),
         pd.Timestamp('20170105', tz='UTC'),
@@ -379,7 +389,7 @@ def test_complex_window(client):
         .execute(timecontext=context)
     )
 
-    df = table.execute()
+    df = time_indexed_df
     expected_win_1h = (
         df.set_index('time')
         .groupby('key')
@@ -1,3 +1,4 @@
+import functools
 from typing import List, Optional
 
 import pyspark.sql.functions as F
@@ -8,6 +9,24 @@ from ibis.expr.timecontext import get_time_col
 from ibis.expr.typing import TimeContext
 
 
+@functools.lru_cache(maxsize=64)
+def _time_range_predicate(spark_context, time_col, begin, end):
+    """Build the time context filter predicate once per time range.
+
+    ``spark_context`` is only part of the cache key, so that columns are not
+    shared across Spark contexts.
+    """
+    # For py3.8, underlying spark type converter calls utctimetuple()
+    # and will throw excpetion for Timestamp type if tz is set.
+    # See https://github.com/pandas-dev/pandas/issues/32174
+    # Dropping tz will cause spark to interpret begin, end with session
+    # timezone & os env TZ. We convert Timestamp to pydatetime to
+    # workaround.
+    return (F.col(time_col) >= begin.to_pydatetime()) & (
+        F.col(time_col) < end.to_pydatetime()
+    )
+
+
 def filter_by_time_context(
     df: DataFrame,
     timecontext: Optional[TimeContext],
@@ -25,26 +44,15 @@ def filter_by_time_context(
     """
     # Return original df if there is no timecontext (timecontext is not used)
     # or timecontext and adjusted_timecontext are the same
-    if (not timecontext) or (
-        timecontext
-        and adjusted_timecontext
-        and timecontext == adjusted_timecontext
-    ):
+    if timecontext is None or timecontext == adjusted_timecontext:
         return df
 
     time_col = get_time_col()
-    if time_col in df.columns:
-        # For py3.8, underlying spark type converter calls utctimetuple()
-        # and will throw excpetion for Timestamp type if tz is set.
-        # See https://github.com/pandas-dev/pandas/issues/32174
-        # Dropping tz will cause spark to interpret begin, end with session
-        # timezone & os env TZ. We convert Timestamp to pydatetime to
-        # workaround.
+    # StructType keeps its field names in a list, while df.columns builds a
+    # new one from the fields on every access
+    if time_col in df.schema.names:
         begin, end = timecontext
-        return df.filter(
-            (F.col(time_col) >= begin.to_pydatetime())
-            & (F.col(time_col) < end.to_pydatetime())
-        )
+        return df.filter(_time_range_predicate(df._sc, time_col, begin, end))
     else:
         raise com.TranslationError(
             "'time' column missing in Dataframe {}."
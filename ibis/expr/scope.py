@@ -127,12 +127,13 @@ class Scope:
         result: the cached result, an object whose types may differ in
         different backends.
         """
-        if op not in self:
+        item = self._items.get(op)
+        if item is None:
             return None
 
         # for ops without timecontext
         if timecontext is None:
-            return self._items[op].value
+            return item.value
         else:
             # For op with timecontext, ther are some ops cannot use cached
             # result with a different (larger) timecontext to get the
@@ -145,13 +146,16 @@ class Scope:
             # These are time context sensitive operations. Since these cases
             # are rare in acutal use case, we just enable optimization for
             # all nodes for now.
-            cached_timecontext = self._items[op].timecontext
-            if cached_timecontext:
-                relation = compare_timecontext(timecontext, cached_timecontext)
-                if relation == TimeContextRelation.SUBSET:
-                    return self._items[op].value
-            else:
-                return self._items[op].value
+            cached_timecontext = item.timecontext
+            # The same time context object is usually passed down the whole
+            # tree, so check identity before comparing timestamps.
+            if (
+                not cached_timecontext
+                or cached_timecontext is timecontext
+                or compare_timecontext(timecontext, cached_timecontext)
+                == TimeContextRelation.SUBSET
+            ):
+                return item.value
         return None
 
     def merge_scope(self, other_scope: 'Scope', overwrite=False) -> 'Scope':
@@ -171,18 +175,8 @@ class Scope:
             a new Scope instance with items in two scope merged.
         """
         result = Scope()
-
-        for op in self:
-            result._items[op] = self._items[op]
-
-        for op in other_scope:
-            # if get_scope returns a not None value, then data is already
-            # cached in scope and it is at least a greater range than
-            # the current timecontext, so we drop the item. Otherwise
-            # add it into scope.
-            v = other_scope._items[op]
-            if overwrite or result.get_value(op, v.timecontext) is None:
-                result._items[op] = v
+        result._items = dict(self._items)
+        result._update(other_scope, overwrite)
         return result
 
     def merge_scopes(
@@ -203,9 +197,22 @@ class Scope:
             a new Scope instance with items in two scope merged.
         """
         result = Scope()
-        for op in self:
-            result._items[op] = self._items[op]
-
+        result._items = dict(self._items)
         for s in other_scopes:
-            result = result.merge_scope(s, overwrite)
+            result._update(s, overwrite)
         return result
+
+    def _update(self, other_scope: 'Scope', overwrite=False) -> None:
+        """merge items in other_scope into this scope in place"""
+        items = self._items
+        for op, v in other_scope._items.items():
+            # if get_scope returns a not None value, then data is already
+            # cached in scope and it is at least a greater range than
+            # the current timecontext, so we drop the item. Otherwise
+            # add it into scope.
+            if (
+                overwrite
+                or op not in items
+                or self.get_value(op, v.timecontext) is None
+            ):
+                items[op] = v
@@ -129,6 +129,10 @@ def canonicalize_context(
         raise com.IbisError(
             f'begin time {begin} must be before or equal' f' to end time {end}'
         )
+    # return canonical contexts as is, so that the identity of the context
+    # passed down the tree is preserved
+    if type(timecontext) is tuple:
+        return timecontext
     return begin, end
 
 